@@ -8,6 +8,7 @@ from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime
 import json
 import logging
+import uuid
 from enum import Enum
 
 from agents.base import BaseAgent
@@ -78,7 +79,11 @@ class AgentController:
     async def submit_task(self, task_type: TaskType, input_data: Dict[str, Any], 
                          priority: int = 0, callback: Callable = None) -> str:
         """提交任务"""
-        task_id = f"task_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{len(self.active_tasks)}"
+        if self.config.task_backend == "celery":
+            # Celery 任务 ID 在多个 API 进程和重启之间共享命名空间，必须全局唯一
+            task_id = f"task_{uuid.uuid4().hex}"
+        else:
+            task_id = f"task_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{len(self.active_tasks)}"
         
         task = {
             "id": task_id,
@@ -95,8 +100,19 @@ class AgentController:
             "agent_results": {}
         }
         
-        self.active_tasks[task_id] = task
-        await self.task_queue.put((priority, task))
+        if self.config.task_backend == "celery":
+            # 交给独立的 Celery worker 执行，API 进程只负责等待结果；发布到 Redis 为阻塞调用
+            from celery_app import execute_agent_task
+            task["async_result"] = await asyncio.to_thread(
+                execute_agent_task.apply_async,
+                args=(task_type.value, input_data),
+                task_id=task_id,
+                priority=priority
+            )
+            self.active_tasks[task_id] = task
+        else:
+            self.active_tasks[task_id] = task
+            await self.task_queue.put((priority, task))
         
         logger.info(f"任务已提交: {task_id}, 类型: {task_type.value}")
         return task_id
@@ -115,19 +131,12 @@ class AgentController:
                 
                 await self._trigger_event("task_started", task)
                 
-                # 根据任务类型执行相应的逻辑
-                if task["type"] == TaskType.PAPER_HUNTING:
-                    result = await self._execute_paper_hunting(task)
-                elif task["type"] == TaskType.PAPER_ANALYSIS:
-                    result = await self._execute_paper_analysis(task)
-                elif task["type"] == TaskType.WRITING_ASSISTANCE:
-                    result = await self._execute_writing_assistance(task)
-                elif task["type"] == TaskType.CITATION_VALIDATION:
-                    result = await self._execute_citation_validation(task)
-                elif task["type"] == TaskType.FULL_WORKFLOW:
-                    result = await self._execute_full_workflow(task)
+                if task.get("async_result") is not None:
+                    result = await asyncio.to_thread(
+                        task["async_result"].get, timeout=self.config.agent_timeout
+                    )
                 else:
-                    raise AgentException(f"不支持的任务类型: {task['type']}")
+                    result = await self.dispatch_task(task)
                 
                 task["status"] = TaskStatus.COMPLETED
                 task["completed_at"] = datetime.now()
@@ -152,9 +161,24 @@ class AgentController:
                 raise AgentException(f"任务执行失败: {str(e)}")
             
             finally:
-                # 移动到历史记录
-                self.task_history.append(task.copy())
-                del self.active_tasks[task_id]
+                # 移动到历史记录（celery 模式下状态查询可能已先行归档）
+                if self.active_tasks.pop(task_id, None) is not None:
+                    self.task_history.append(task.copy())
+    
+    async def dispatch_task(self, task: Dict) -> Dict[str, Any]:
+        """根据任务类型执行相应的逻辑"""
+        if task["type"] == TaskType.PAPER_HUNTING:
+            return await self._execute_paper_hunting(task)
+        elif task["type"] == TaskType.PAPER_ANALYSIS:
+            return await self._execute_paper_analysis(task)
+        elif task["type"] == TaskType.WRITING_ASSISTANCE:
+            return await self._execute_writing_assistance(task)
+        elif task["type"] == TaskType.CITATION_VALIDATION:
+            return await self._execute_citation_validation(task)
+        elif task["type"] == TaskType.FULL_WORKFLOW:
+            return await self._execute_full_workflow(task)
+        else:
+            raise AgentException(f"不支持的任务类型: {task['type']}")
     
     async def _execute_paper_hunting(self, task: Dict) -> Dict[str, Any]:
         """执行论文抓取任务"""
@@ -307,10 +331,38 @@ class AgentController:
                 logger.error(f"任务处理器异常: {str(e)}")
                 await asyncio.sleep(1)
     
+    async def _refresh_remote_task(self, task: Dict):
+        """根据 Celery 结果同步远程任务状态，任务结束时移入历史记录"""
+        async_result = task.get("async_result")
+        if async_result is None or task["status"] not in (TaskStatus.PENDING, TaskStatus.RUNNING):
+            return
+        
+        state = await asyncio.to_thread(lambda: async_result.state)
+        if state in ("STARTED", "RETRY"):
+            if task["status"] == TaskStatus.PENDING:
+                task["status"] = TaskStatus.RUNNING
+                task["started_at"] = datetime.now()
+            return
+        if state == "SUCCESS":
+            task["status"] = TaskStatus.COMPLETED
+            task["result"] = await asyncio.to_thread(lambda: async_result.result)
+        elif state == "FAILURE":
+            task["status"] = TaskStatus.FAILED
+            task["error"] = str(await asyncio.to_thread(lambda: async_result.result))
+        elif state == "REVOKED":
+            task["status"] = TaskStatus.CANCELLED
+        else:
+            return
+        
+        task["completed_at"] = datetime.now()
+        if self.active_tasks.pop(task["id"], None) is not None:
+            self.task_history.append(task.copy())
+    
     async def get_task_status(self, task_id: str) -> Optional[Dict]:
         """获取任务状态"""
         if task_id in self.active_tasks:
             task = self.active_tasks[task_id]
+            await self._refresh_remote_task(task)
             return {
                 "id": task["id"],
                 "type": task["type"].value,
@@ -339,7 +391,10 @@ class AgentController:
         """取消任务"""
         if task_id in self.active_tasks:
             task = self.active_tasks[task_id]
+            await self._refresh_remote_task(task)
             if task["status"] == TaskStatus.PENDING:
+                if task.get("async_result") is not None:
+                    await asyncio.to_thread(task["async_result"].revoke)
                 task["status"] = TaskStatus.CANCELLED
                 task["completed_at"] = datetime.now()
                 
@@ -354,6 +409,10 @@ class AgentController:
     
     async def get_agent_status(self) -> Dict[str, Any]:
         """获取所有智能体状态"""
+        return self.get_agent_status_sync()
+    
+    def get_agent_status_sync(self) -> Dict[str, Any]:
+        """获取所有智能体状态（同步版本，可在线程池中调用）"""
         agent_status = {}
         for name, agent in self.agents.items():
             agent_status[name] = agent.get_status()
@@ -392,9 +451,10 @@ class AgentController:
         """关闭控制器"""
         logger.info("关闭Agent Controller...")
         
-        # 取消所有待处理任务
-        for task_id in list(self.active_tasks.keys()):
-            await self.cancel_task(task_id)
+        # 取消所有待处理的本地任务；celery 任务由 worker 继续执行，API 进程重启时不撤销
+        for task_id, task in list(self.active_tasks.items()):
+            if task.get("async_result") is None:
+                await self.cancel_task(task_id)
         
         # 清理智能体资源
         for agent in self.agents.values():
@@ -2,13 +2,24 @@
 InnoCore API 主应用
 """
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import ORJSONResponse, HTMLResponse, Response
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from contextlib import asynccontextmanager
+import asyncio
+import gzip
 import logging
+import signal
+import sys
+import time
+import orjson
 import uvicorn
 from datetime import datetime, timezone
+from pathlib import Path
 
 from core.config import get_config
 from core.database import db_manager
@@ -16,51 +27,93 @@ from core.vector_store import vector_store_manager
 from agents.controller import agent_controller
 from .routes import papers, users, tasks, analysis, writing, citations, workflow
 
+config = get_config()
+
 # 配置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logger.setLevel(getattr(logging, config.log_level.upper(), logging.INFO))
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """应用生命周期管理"""
-    # 启动时初始化
-    logger.info("正在启动InnoCore AI...")
-    
-    # 初始化数据库（可选）
+async def _init_db():
+    """初始化数据库（可选）"""
     try:
         await db_manager.initialize()
         logger.info("数据库初始化完成")
     except Exception as e:
-        logger.warning(f"数据库初始化失败（将以无数据库模式运行）: {str(e)}")
-    
-    # 初始化向量存储（可选）
+        logger.warning("数据库初始化失败（将以无数据库模式运行）: %s", e)
+        raise
+
+
+async def _init_vs():
+    """初始化向量存储（可选）"""
     try:
         await vector_store_manager.initialize()
         logger.info("向量存储初始化完成")
     except Exception as e:
-        logger.warning(f"向量存储初始化失败（将以无向量存储模式运行）: {str(e)}")
-    
-    # 初始化智能体控制器（可选）
+        logger.warning("向量存储初始化失败（将以无向量存储模式运行）: %s", e)
+        raise
+
+
+async def _init_agents():
+    """初始化智能体控制器（可选）"""
     try:
         await agent_controller.initialize()
         logger.info("智能体控制器初始化完成")
-        
-        # 启动任务处理器
-        import asyncio
+    except Exception as e:
+        logger.warning("智能体控制器初始化失败: %s", e)
+        raise
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """应用生命周期管理"""
+    # 启动时初始化
+    logger.info("正在启动InnoCore AI...")
+
+    # 单进程运行时收到 SIGHUP 重新加载前端首页（Windows 不支持；多进程下 SIGHUP 会重启 worker）
+    if hasattr(signal, "SIGHUP"):
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, _load_index)
+        except (NotImplementedError, RuntimeError):
+            pass
+
+    # Python 3.12+ 使用 eager task，新任务在首次挂起前同步执行，减少事件循环调度开销
+    if sys.version_info >= (3, 12):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    # 三项初始化互不依赖，并发执行；失败已在各自函数中记录
+    db_result, _, agents_result = await asyncio.gather(
+        _init_db(), _init_vs(), _init_agents(), return_exceptions=True
+    )
+
+    # 预热数据库连接池，避免首个请求承担建连开销
+    # （向量存储客户端在初始化创建集合时已完成连接）
+    if not isinstance(db_result, BaseException):
+        try:
+            await db_manager.warm_up()
+        except Exception as e:
+            logger.warning("数据库连接预热失败: %s", e)
+
+    # 启动任务处理器（celery 模式下由独立 worker 进程处理任务）
+    if not isinstance(agents_result, BaseException) and config.task_backend == "local":
         asyncio.create_task(agent_controller.start_task_processor())
         logger.info("任务处理器已启动")
-    except Exception as e:
-        logger.warning(f"智能体控制器初始化失败: {str(e)}")
-    
+
     logger.info("InnoCore AI 启动完成")
-    
+
     yield
-    
+
     # 关闭时清理
     logger.info("正在关闭InnoCore AI...")
-    await agent_controller.shutdown()
-    await db_manager.close()
-    await vector_store_manager.close()
+    shutdown_results = await asyncio.gather(
+        agent_controller.shutdown(),
+        db_manager.close(),
+        vector_store_manager.close(),
+        return_exceptions=True
+    )
+    for label, result in zip(("智能体控制器", "数据库", "向量存储"), shutdown_results):
+        if isinstance(result, BaseException):
+            logger.warning("%s关闭失败: %s", label, result)
     logger.info("InnoCore AI已关闭")
 
 # 创建FastAPI应用
@@ -68,48 +121,119 @@ app = FastAPI(
     title="InnoCore Research API",
     description="智能科研创新助手API",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # 配置CORS
-config = get_config()
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # 生产环境应该限制具体域名
+    allow_origins=config.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=config.cors_max_age,
 )
 
+# 压缩较大的 JSON/HTML 响应
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
+
+def _accepts_gzip(request: Request) -> bool:
+    """客户端是否接受 gzip 编码（按 Accept-Encoding 的 q 值判断，q=0 表示拒绝）"""
+    qualities = {}
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip().lower()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        qualities[coding] = q
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
 # 注册路由
-app.include_router(papers.router, prefix="/api/v1/papers", tags=["papers"])
-app.include_router(users.router, prefix="/api/v1/users", tags=["users"])
-app.include_router(tasks.router, prefix="/api/v1/tasks", tags=["tasks"])
-app.include_router(analysis.router, prefix="/api/v1/analysis", tags=["analysis"])
-app.include_router(writing.router, prefix="/api/v1/writing", tags=["writing"])
-app.include_router(citations.router, prefix="/api/v1/citations", tags=["citations"])
-app.include_router(workflow.router, prefix="/api/v1/workflow", tags=["workflow"])
+_ROUTES = (
+    (papers.router, "papers"),
+    (users.router, "users"),
+    (tasks.router, "tasks"),
+    (analysis.router, "analysis"),
+    (writing.router, "writing"),
+    (citations.router, "citations"),
+    (workflow.router, "workflow"),
+)
+for _router, _name in _ROUTES:
+    app.include_router(_router, prefix=f"/api/v1/{_name}", tags=[_name])
+del _router, _name
 
 # 挂载静态文件
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
 import os
 
 # 获取项目根目录
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 FRONTEND_DIR = os.path.join(BASE_DIR, "frontend")
 
+# 路径与存在性只在导入时计算一次
+_STATIC_DIR = os.path.join(FRONTEND_DIR, "static")
+_STATIC_EXISTS = os.path.isdir(_STATIC_DIR)
+_TEMPLATES_DIR = os.path.join(FRONTEND_DIR, "templates")
+_TEMPLATES_EXISTS = os.path.isdir(_TEMPLATES_DIR)
+_INDEX_PATH = os.path.join(FRONTEND_DIR, "index.html")
+_INDEX_HEADERS = {"Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+_INDEX_GZIP_HEADERS = {**_INDEX_HEADERS, "Content-Encoding": "gzip"}
+_INDEX_BYTES = None
+_INDEX_GZIP_BYTES = None
+
+
+def _load_index():
+    """将前端首页及其 gzip 压缩版本读入内存
+
+    单进程运行时，向该进程发送 SIGHUP 会重新加载首页；多进程（uvicorn workers / gunicorn）
+    下 SIGHUP 由主进程接收并重启各 worker，首页随 worker 重启重新加载。
+    """
+    global _INDEX_BYTES, _INDEX_GZIP_BYTES
+    try:
+        _INDEX_BYTES = Path(_INDEX_PATH).read_bytes()
+        _INDEX_GZIP_BYTES = gzip.compress(_INDEX_BYTES, 6)
+    except FileNotFoundError:
+        _INDEX_BYTES = None
+        _INDEX_GZIP_BYTES = None
+
+
+_load_index()
+
 # 挂载静态资源
-if os.path.exists(os.path.join(FRONTEND_DIR, "static")):
-    app.mount("/static", StaticFiles(directory=os.path.join(FRONTEND_DIR, "static")), name="static")
+if _STATIC_EXISTS:
+    app.mount("/static", StaticFiles(directory=_STATIC_DIR), name="static")
+
+# 挂载前端页面模板（app.js 按需加载 /templates/*.html）
+if _TEMPLATES_EXISTS:
+    app.mount("/templates", StaticFiles(directory=_TEMPLATES_DIR), name="templates")
 
-# 根路径 - 返回前端页面
+# 根路径 - 返回内存中的前端首页，首页不存在时返回 API 信息
 @app.get("/")
-async def root():
+async def root(request: Request):
     """根路径 - 返回前端首页"""
-    index_path = os.path.join(FRONTEND_DIR, "index.html")
-    if os.path.exists(index_path):
-        return FileResponse(index_path)
+    # 客户端支持时直接返回预压缩内容，避免 GZipMiddleware 每次重新压缩
+    if _INDEX_GZIP_BYTES is not None and _accepts_gzip(request):
+        return Response(
+            content=_INDEX_GZIP_BYTES,
+            media_type="text/html; charset=utf-8",
+            headers=_INDEX_GZIP_HEADERS
+        )
+    if _INDEX_BYTES is not None:
+        return Response(
+            content=_INDEX_BYTES,
+            media_type="text/html; charset=utf-8",
+            headers=_INDEX_HEADERS
+        )
     return {
         "message": "Welcome to InnoCore Research API",
         "version": "0.1.0",
@@ -117,15 +241,25 @@ async def root():
     }
 
 # 健康检查
-@app.get("/health")
-async def health_check():
-    """健康检查"""
+_HEALTH_STATUS_TIMEOUT = 1.0  # 获取智能体状态的超时时间(秒)
+_HEALTH_CACHE_TTL = 1.0  # 健康检查结果缓存时间(秒)，探针高频访问时合并为一次计算
+_HEALTH_CACHE = {"ts": float("-inf"), "body": b"", "status": 200}
+_health_lock = asyncio.Lock()
+
+
+async def _build_health_status():
+    """获取健康状态，返回 (状态码, 内容)"""
     try:
-        agent_status = await agent_controller.get_agent_status()
+        # 在线程池中获取状态并限制耗时，避免阻塞事件循环或拖住存活探针
+        agent_status = await asyncio.wait_for(
+            run_in_threadpool(agent_controller.get_agent_status_sync),
+            timeout=_HEALTH_STATUS_TIMEOUT
+        )
 
-        return {
+        return 200, {
             "status": "healthy",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # 与响应体一同缓存，每个 TTL 周期最多生成一次；orjson 原生输出 ISO 8601
+            "timestamp": datetime.now(timezone.utc),
             "agents": agent_status.get("agents", {}),
             "stats": {
                 "active_tasks": agent_status.get("active_tasks", 0),
@@ -134,19 +268,48 @@ async def health_check():
                 "max_concurrent": agent_status.get("max_concurrent", 0)
             }
         }
+    except asyncio.TimeoutError:
+        return 503, {
+            "status": "unhealthy",
+            "error": "获取智能体状态超时"
+        }
     except Exception as e:
-        return JSONResponse(
-            status_code=503,
-            content={
-                "status": "unhealthy",
-                "error": str(e)
-            }
-        )
+        return 503, {
+            "status": "unhealthy",
+            "error": str(e)
+        }
 
 
-@app.get("/health/ui", response_class=HTMLResponse)
-async def health_ui():
-    html = """<!doctype html>
+_HEALTHZ_BODY = b'{"status":"ok"}'
+
+
+@app.get("/healthz")
+async def healthz():
+    """存活探针 - 不访问智能体与外部依赖，供负载均衡和 k8s 探针高频调用"""
+    return Response(content=_HEALTHZ_BODY, media_type="application/json")
+
+
+@app.get("/health")
+async def health_check():
+    """健康检查"""
+    if time.monotonic() - _HEALTH_CACHE["ts"] >= _HEALTH_CACHE_TTL:
+        async with _health_lock:
+            # 等锁期间可能已被其他请求刷新
+            if time.monotonic() - _HEALTH_CACHE["ts"] >= _HEALTH_CACHE_TTL:
+                status_code, content = await _build_health_status()
+                _HEALTH_CACHE["body"] = orjson.dumps(content, default=str)
+                _HEALTH_CACHE["status"] = status_code
+                _HEALTH_CACHE["ts"] = time.monotonic()
+
+    return Response(
+        content=_HEALTH_CACHE["body"],
+        media_type="application/json",
+        status_code=_HEALTH_CACHE["status"]
+    )
+
+
+# 健康检查页面为纯静态内容，导入时构建一次，避免每次请求重建字符串
+_HEALTH_UI_HTML = """<!doctype html>
 <html lang=\"zh-CN\">
   <head>
     <meta charset=\"utf-8\" />
@@ -429,27 +592,61 @@ async def health_ui():
     </script>
   </body>
 </html>"""
+_HEALTH_UI_BYTES = _HEALTH_UI_HTML.encode("utf-8")
+_HEALTH_UI_GZIP_BYTES = gzip.compress(_HEALTH_UI_BYTES, 6)
+_HEALTH_UI_HEADERS = {"Cache-Control": "public, max-age=300", "Vary": "Accept-Encoding"}
+_HEALTH_UI_GZIP_HEADERS = {**_HEALTH_UI_HEADERS, "Content-Encoding": "gzip"}
 
-    return HTMLResponse(content=html)
+
+@app.get("/health/ui", response_class=HTMLResponse)
+async def health_ui(request: Request):
+    """健康状态页面"""
+    # 客户端支持时直接返回预压缩内容，GZipMiddleware 会跳过已编码的响应
+    if _accepts_gzip(request):
+        return Response(
+            content=_HEALTH_UI_GZIP_BYTES,
+            media_type="text/html; charset=utf-8",
+            headers=_HEALTH_UI_GZIP_HEADERS
+        )
+    return Response(
+        content=_HEALTH_UI_BYTES,
+        media_type="text/html; charset=utf-8",
+        headers=_HEALTH_UI_HEADERS
+    )
 
 # 全局异常处理
+_ERR_500 = {"error": "Internal server error", "message": "Something went wrong"}
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """全局异常处理器"""
-    logger.error(f"全局异常: {str(exc)}")
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": "Internal server error",
-            "message": str(exc) if config.debug else "Something went wrong"
-        }
-    )
+    # HTTPException 交给 FastAPI 默认处理器，保持原有状态码和 detail
+    if isinstance(exc, StarletteHTTPException):
+        return await http_exception_handler(request, exc)
+
+    logger.error("全局异常: %s", exc)
+    if config.debug:
+        return ORJSONResponse(
+            status_code=500,
+            content={"error": "Internal server error", "message": str(exc)}
+        )
+    return ORJSONResponse(status_code=500, content=_ERR_500)
 
 if __name__ == "__main__":
+    # 任务状态（active_tasks/task_history/task_queue）只存在于单个进程内，默认单进程；
+    # 只有在任务状态共享之后才能通过 API_WORKERS 或
+    # gunicorn -k uvicorn.workers.UvicornWorker -w <N> innocore_ai.api.main:app 扩展进程数
+    # reload 模式下 uvicorn 只支持单进程
     uvicorn.run(
         "innocore_ai.api.main:app",
         host="0.0.0.0",
         port=8000,
         reload=config.debug,
+        workers=1 if config.debug else config.api_workers,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop 不支持 Windows
+        http="httptools",
+        limit_concurrency=config.api_limit_concurrency,
+        timeout_keep_alive=30,
         log_level="info"
     )
@@ -0,0 +1,103 @@
+"""
+InnoCore AI Celery 应用
+在独立 worker 进程中执行智能体任务，避免长任务占用 API 事件循环
+
+启动 worker:
+    celery -A celery_app worker -c 8
+"""
+
+import asyncio
+import logging
+from typing import Dict, Any, Optional
+
+from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from core.config import get_config
+from core.database import db_manager
+from core.vector_store import vector_store_manager
+
+config = get_config()
+logger = logging.getLogger(__name__)
+
+# 每个 worker 子进程持有一个常驻事件循环，数据库连接池等资源绑定在该循环上
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _redis_url(db: int) -> str:
+    """构建Redis连接地址"""
+    auth = f":{config.redis.password}@" if config.redis.password else ""
+    return f"redis://{auth}{config.redis.host}:{config.redis.port}/{db}"
+
+
+celery_app = Celery("innocore", broker=_redis_url(1), backend=_redis_url(2))
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    # 智能体任务耗时长，每个 worker 进程一次只取一个任务
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    # 上报 STARTED 状态，供 API 进程查询任务进度
+    task_track_started=True,
+    task_time_limit=config.agent_timeout,
+    task_soft_time_limit=max(config.agent_timeout - 30, 1),
+)
+
+
+async def _init_resources():
+    """初始化 worker 进程内的数据库与向量存储（可选）"""
+    try:
+        await db_manager.initialize()
+    except Exception as e:
+        logger.warning("worker 数据库初始化失败: %s", e)
+    try:
+        await vector_store_manager.initialize()
+    except Exception as e:
+        logger.warning("worker 向量存储初始化失败: %s", e)
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """获取当前 worker 进程的事件循环，首次调用时创建并初始化资源"""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+        _loop.run_until_complete(_init_resources())
+    return _loop
+
+
+@worker_process_init.connect
+def _on_worker_process_init(**kwargs):
+    """worker 子进程启动时创建事件循环并初始化资源"""
+    _get_loop()
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(**kwargs):
+    """worker 子进程退出时关闭资源和事件循环"""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        return
+    results = _loop.run_until_complete(asyncio.gather(
+        db_manager.close(), vector_store_manager.close(), return_exceptions=True
+    ))
+    for label, result in zip(("数据库", "向量存储"), results):
+        if isinstance(result, BaseException):
+            logger.warning("worker %s关闭失败: %s", label, result)
+    _loop.close()
+    _loop = None
+
+
+@celery_app.task(name="innocore.execute_agent_task", bind=True)
+def execute_agent_task(self, task_type: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """在 worker 中执行智能体任务"""
+    from agents.controller import agent_controller, TaskType
+
+    task = {
+        "id": self.request.id,
+        "type": TaskType(task_type),
+        "input_data": input_data,
+        "agent_results": {}
+    }
+    return _get_loop().run_until_complete(agent_controller.dispatch_task(task))
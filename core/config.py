@@ -43,6 +43,8 @@ class VectorDBConfig:
     db_type: VectorDBType = VectorDBType.QDRANT
     host: str = "localhost"
     port: int = 6333
+    grpc_port: int = 6334
+    prefer_grpc: bool = False  # 使用长连接的 gRPC 通道
     api_key: Optional[str] = None
     collection_name_prefix: str = "innocore"
     embedding_model: str = "text-embedding-3-small"
@@ -56,6 +58,7 @@ class DatabaseConfig:
     username: str = "postgres"
     password: str = "password"
     pool_size: int = 10
+    pool_min_size: int = 2  # 启动时预热的连接数
 
 @dataclass
 class RedisConfig:
@@ -103,6 +106,7 @@ class InnoCoreConfig:
     agent_max_steps: int = 5
     agent_timeout: int = 300
     concurrent_agents: int = 4
+    task_backend: str = "local"  # local: 进程内任务处理器; celery: 独立 Celery worker 执行
     
     # RAG配置
     retrieval_top_k: int = 5
@@ -116,6 +120,17 @@ class InnoCoreConfig:
     cache_ttl: int = 3600  # 缓存过期时间(秒)
     batch_size: int = 10
     max_concurrent_requests: int = 50
+    # API 进程数；任务状态保存在进程内存中，多进程前需先改为共享任务状态
+    api_workers: int = 1
+    # uvicorn 最大并发连接数（包括空闲 keep-alive 连接和 websocket）
+    api_limit_concurrency: int = 1000
+    
+    # CORS配置（逗号分隔的环境变量 CORS_ORIGINS 覆盖）
+    cors_origins: List[str] = field(default_factory=lambda: [
+        "http://localhost:8000",
+        "http://127.0.0.1:8000"
+    ])
+    cors_max_age: int = 86400  # 预检请求缓存时间(秒)
     
     def __post_init__(self):
         """初始化后处理"""
@@ -128,6 +143,9 @@ class InnoCoreConfig:
         if env_model:
             self.llm.model_name = env_model
         
+        self.vector_db.prefer_grpc = os.getenv("QDRANT_PREFER_GRPC", str(self.vector_db.prefer_grpc)).lower() == "true"
+        self.vector_db.grpc_port = int(os.getenv("QDRANT_GRPC_PORT", self.vector_db.grpc_port))
+        
         self.database.password = self.database.password or os.getenv("DATABASE_PASSWORD")
         self.redis.password = self.redis.password or os.getenv("REDIS_PASSWORD")
         
@@ -137,6 +155,13 @@ class InnoCoreConfig:
         
         self.debug = os.getenv("DEBUG", "false").lower() == "true"
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
+        self.task_backend = os.getenv("TASK_BACKEND", self.task_backend).lower()
+        self.api_workers = int(os.getenv("API_WORKERS", self.api_workers))
+        self.api_limit_concurrency = int(os.getenv("API_LIMIT_CONCURRENCY", self.api_limit_concurrency))
+        
+        env_cors_origins = os.getenv("CORS_ORIGINS")
+        if env_cors_origins:
+            self.cors_origins = [origin.strip() for origin in env_cors_origins.split(",") if origin.strip()]
 
 # 全局配置实例
 config = InnoCoreConfig()
@@ -29,13 +29,28 @@ class DatabaseManager:
                 database=self.config.database,
                 user=self.config.username,
                 password=self.config.password,
-                min_size=1,
+                min_size=min(self.config.pool_min_size, self.config.pool_size),
                 max_size=self.config.pool_size
             )
             await self._create_tables()
         except Exception as e:
             raise DatabaseException(f"数据库初始化失败: {str(e)}")
     
+    async def warm_up(self, n: int = None):
+        """预热连接池，避免首个请求承担建连开销"""
+        if not self.pool:
+            return
+        
+        n = min(n or self.config.pool_min_size, self.config.pool_size)
+        conns = []
+        try:
+            for _ in range(n):
+                conns.append(await self.pool.acquire())
+            await asyncio.gather(*(conn.execute("SELECT 1") for conn in conns))
+        finally:
+            for conn in conns:
+                await self.pool.release(conn)
+    
     async def _create_tables(self):
         """创建数据库表"""
         create_tables_sql = """
@@ -25,14 +25,21 @@ class VectorStoreManager:
     
     async def initialize(self):
         """初始化向量数据库连接"""
+        # 整个进程共用一个长连接客户端，重复初始化时直接复用
+        if self.client is not None:
+            return
+        
         try:
             self.client = QdrantClient(
                 host=self.config.host,
                 port=self.config.port,
+                grpc_port=self.config.grpc_port,
+                prefer_grpc=self.config.prefer_grpc,
                 api_key=self.config.api_key
             )
             await self._create_collections()
         except Exception as e:
+            self.client = None
             raise VectorStoreException(f"向量数据库初始化失败: {str(e)}")
     
     async def _create_collections(self):
@@ -276,6 +283,7 @@ class VectorStoreManager:
         """关闭向量数据库连接"""
         if self.client:
             self.client.close()
+            self.client = None
 
 # 全局向量存储管理器实例
 vector_store_manager = VectorStoreManager()
\ No newline at end of file